@@ -512,9 +512,11 @@ def _process_metadata_row(row_data: tuple) -> Optional[tuple]:
     Returns:
         Optional[tuple]: Processed row data matching database schema, or None if invalid
     """
+    # Per-row rejections are logged at debug level only; refresh_library emits a
+    # single summary warning for everything it skipped.
     try:
         if not row_data or len(row_data) < 9:
-            logger.warning(f"Invalid row data structure: {row_data}")
+            logger.debug("Invalid row data structure: %r", row_data)
             return None
 
         # Extract fields from the row
@@ -522,21 +524,21 @@ def _process_metadata_row(row_data: tuple) -> Optional[tuple]:
 
         # Validate required fields
         if not path:
-            logger.warning("Missing required field 'path' in metadata row")
+            logger.debug("Missing required field 'path' in metadata row")
             return None
 
         if not norm:
-            logger.warning(f"Missing required field 'norm' for path: {path}")
+            logger.debug("Missing required field 'norm' for path: %s", path)
             return None
 
         # Validate path exists and is accessible
         try:
             path_obj = Path(path)
             if not path_obj.exists():
-                logger.warning(f"File no longer exists: {path}")
+                logger.debug("File no longer exists: %s", path)
                 return None
         except (OSError, ValueError) as e:
-            logger.warning(f"Invalid path in metadata: {path} - {e}")
+            logger.debug("Invalid path in metadata: %s - %s", path, e)
             return None
 
         # Convert trackno to track_number (field name standardization)
@@ -571,6 +573,45 @@ def _process_metadata_row(row_data: tuple) -> Optional[tuple]:
         return None
 
 
+# Paths checked per mtime lookup query; two bound parameters per path keeps each
+# statement well under SQLite's default host parameter limit (999).
+_MTIME_LOOKUP_CHUNK = 400
+
+
+def _stale_paths(
+    cursor: sqlite3.Cursor, candidates: List[Tuple[Path, int]]
+) -> List[Path]:
+    """
+    Return the candidates whose on-disk mtime differs from the indexed one.
+
+    Looks up the whole chunk in a single statement by joining an inline
+    ``VALUES`` table against ``flacs`` instead of issuing one query per file.
+
+    Args:
+        cursor: Database cursor
+        candidates: (file path, on-disk mtime) pairs
+
+    Returns:
+        list[Path]: Paths that are new or modified, in input order
+    """
+    if not candidates:
+        return []
+
+    values = ",".join("(?,?)" for _ in candidates)
+    params: List[Any] = []
+    for file_path, file_mtime in candidates:
+        params.extend((str(file_path), file_mtime))
+
+    cursor.execute(
+        f"WITH input(path, mtime) AS (VALUES {values}) "
+        "SELECT input.path FROM input LEFT JOIN flacs ON flacs.path = input.path "
+        "WHERE flacs.path IS NULL OR flacs.mtime IS NOT input.mtime",
+        params,
+    )
+    stale = {row[0] for row in cursor.fetchall()}
+    return [file_path for file_path, _ in candidates if str(file_path) in stale]
+
+
 def _find_files_to_scan(
     library_dir: Path, cursor: sqlite3.Cursor, batch_size: int = 1000
 ) -> Generator[list[Path], None, None]:
@@ -586,40 +627,33 @@ def _find_files_to_scan(
     Yields:
         list[Path]: Batches of files that need scanning
     """
-    batch = []
+    batch: list[Path] = []
+    pending: List[Tuple[Path, int]] = []
 
     # Process files in chunks to manage memory usage
     for file_path in scan_audio_files(library_dir):
-        path_str = str(file_path)
         file_mtime = _safe_get_mtime(file_path)
 
         if file_mtime is None:
             continue  # Skip inaccessible files
 
-        # Check if file needs scanning using individual query to avoid memory issues
-        cursor.execute("SELECT mtime FROM flacs WHERE path = ?", (path_str,))
-        result = cursor.fetchone()
+        pending.append((file_path, file_mtime))
+        if len(pending) < _MTIME_LOOKUP_CHUNK:
+            continue
 
-        needs_scanning = False
-        if result is None:
-            # File not in database
-            needs_scanning = True
-        else:
-            db_mtime = result[0]
-            if file_mtime != db_mtime:
-                # File has been modified
-                needs_scanning = True
+        batch.extend(_stale_paths(cursor, pending))
+        pending = []
 
-        if needs_scanning:
-            batch.append(file_path)
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
 
-            if len(batch) >= batch_size:
-                yield batch
-                batch = []
+    batch.extend(_stale_paths(cursor, pending))
 
     # Yield remaining files
-    if batch:
-        yield batch
+    while batch:
+        yield batch[:batch_size]
+        batch = batch[batch_size:]
 
 
 def refresh_library(db_path_str: str, library_dir_str: str, quick: bool = True):
@@ -688,6 +722,7 @@ def refresh_library(db_path_str: str, library_dir_str: str, quick: bool = True):
 
             total_processed = 0
             total_updated = 0
+            skipped_paths: List[str] = []
 
             for batch in _find_files_to_scan(library_dir, cur):
                 if not batch:
@@ -720,6 +755,13 @@ def refresh_library(db_path_str: str, library_dir_str: str, quick: bool = True):
                                         processed_row = _process_metadata_row(row_data)
                                         if processed_row:
                                             results.append(processed_row)
+                                        else:
+                                            skipped_paths.append(
+                                                str(row_data[0])
+                                                if isinstance(row_data, tuple)
+                                                and row_data
+                                                else repr(row_data)
+                                            )
                             except Exception as e:
                                 logger.error(f"Error processing file: {e}")
                             finally:
@@ -736,6 +778,13 @@ def refresh_library(db_path_str: str, library_dir_str: str, quick: bool = True):
 
                 total_processed += len(batch)
 
+            if skipped_paths:
+                logger.warning(
+                    "Skipped %d files with invalid metadata (first: %s)",
+                    len(skipped_paths),
+                    skipped_paths[:20],
+                )
+
             if total_processed == 0:
                 console.print("[green]No new or updated files found.[/green]")
             else:
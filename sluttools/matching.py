@@ -3,8 +3,8 @@ import logging
 import os
 import re
 import unicodedata
-from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -12,19 +12,34 @@ from rich.progress import Progress
 from rich.prompt import Prompt
 from thefuzz import process as fuzzy_process
 
-# Prefer rapidfuzz for direct ratio scoring if available
+# Prefer rapidfuzz for best-ratio extraction if available
 try:
     from rapidfuzz import fuzz as rf_fuzz  # type: ignore
+    from rapidfuzz import process as rf_process  # type: ignore
 
-    def _rf_ratio(a: str, b: str) -> float:
-        return float(rf_fuzz.ratio(a, b))
+    def _rf_best_ratio(
+        query: str, choices: list[str], score_cutoff: float
+    ) -> tuple[str, float] | None:
+        res = rf_process.extractOne(
+            query, choices, scorer=rf_fuzz.ratio, score_cutoff=score_cutoff
+        )
+        return (res[0], float(res[1])) if res else None
 
 except Exception:
     # Fallback to thefuzz ratio
     from thefuzz import fuzz as _fw_fuzz  # type: ignore
 
-    def _rf_ratio(a: str, b: str) -> float:
-        return float(_fw_fuzz.ratio(a, b))
+    def _rf_best_ratio(
+        query: str, choices: list[str], score_cutoff: float
+    ) -> tuple[str, float] | None:
+        res = fuzzy_process.extractOne(
+            query,
+            choices,
+            processor=None,
+            scorer=_fw_fuzz.ratio,
+            score_cutoff=score_cutoff,
+        )
+        return (res[0], float(res[1])) if res else None
 
 
 from .config import config, console
@@ -403,6 +418,37 @@ def review_uncertain_matches(uncertain_matches: dict) -> dict[str, str | None]:
     return reviewed_matches
 
 
+# Number of upcoming unmatched tracks scored in the background while the user
+# is answering the prompt for the current one.
+_MANUAL_LOOKAHEAD = 3
+
+
+def _rank_manual_candidates(
+    track: str, path_map: dict, library_choices: list[str], limit: int = 5
+) -> list[tuple[str, float]]:
+    """Score every library entry against an unmatched track; return the top hits.
+
+    Returns a list of (candidate_norm, score) sorted by score descending.
+    """
+    # Use the original path if available, else the normalized string
+    source_path = track if os.path.exists(track) else None
+    if source_path:
+        source_meta = parse_filename_structure(source_path)
+    else:
+        # Try to find the path from the lookup
+        source_meta = parse_filename_structure(path_map.get(track, track))
+    # Score all candidates using metadata-aware scorer
+    scored_candidates = []
+    for norm in library_choices:
+        candidate_path = path_map[norm]
+        candidate_meta = parse_filename_structure(candidate_path)
+        score = calculate_match_score(source_meta, candidate_meta)
+        scored_candidates.append((norm, score))
+    # Sort by score descending, take top N
+    scored_candidates.sort(key=lambda x: x[1], reverse=True)
+    return scored_candidates[:limit]
+
+
 def manual_match_unmatched(
     unmatched_tracks: list, flac_lookup: list[tuple[str, str]]
 ) -> dict[str, str | None]:
@@ -411,44 +457,53 @@ def manual_match_unmatched(
     flac_lookup = _filter_flac_lookup(flac_lookup)
     path_map = {norm: path for path, norm in flac_lookup}
     library_choices = list(path_map.keys())
-    for track in unmatched_tracks:
-        console.print(f"\n[bold red]UNMATCHED:[/] {track}")
-        # Use the original path if available, else the normalized string
-        source_path = track if os.path.exists(track) else None
-        if source_path:
-            source_meta = parse_filename_structure(source_path)
-        else:
-            # Try to find the path from the lookup
-            source_meta = parse_filename_structure(path_map.get(track, track))
-        # Score all candidates using metadata-aware scorer
-        scored_candidates = []
-        for norm in library_choices:
-            candidate_path = path_map[norm]
-            candidate_meta = parse_filename_structure(candidate_path)
-            score = calculate_match_score(source_meta, candidate_meta)
-            scored_candidates.append((norm, score))
-        # Sort by score descending, take top 5
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
-        candidates = scored_candidates[:5]
-        for i, (norm, score) in enumerate(candidates, 1):
-            console.print(f"  {i}) [{score}] {path_map[norm]}")
-        console.print("  s) Skip", "  m) Manual path")
-        # Default to first candidate on Enter for faster manual resolution
-        choice = Prompt.ask(
-            "Choice",
-            choices=[str(i) for i in range(1, len(candidates) + 1)] + ["s", "m"],
-            default="1",
-        )
-        if choice.isdigit() and 1 <= int(choice) <= len(candidates):
-            manual_matches[track] = path_map[candidates[int(choice) - 1][0]]
-        elif choice == "m":
-            manual_path = Prompt.ask("Enter full path").strip()
-            if manual_path and Path(manual_path).exists():
-                manual_matches[track] = manual_path
+
+    # Ranking the whole library is slow, but most of the wall time here is spent
+    # waiting on the user. Score the next few tracks on a worker thread while the
+    # prompt for the current one is blocked on input.
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending: deque[Future] = deque()
+    next_to_submit = 0
+    try:
+        for track in unmatched_tracks:
+            while (
+                next_to_submit < len(unmatched_tracks)
+                and len(pending) <= _MANUAL_LOOKAHEAD
+            ):
+                pending.append(
+                    executor.submit(
+                        _rank_manual_candidates,
+                        unmatched_tracks[next_to_submit],
+                        path_map,
+                        library_choices,
+                    )
+                )
+                next_to_submit += 1
+            candidates = pending.popleft().result()
+
+            console.print(f"\n[bold red]UNMATCHED:[/] {track}")
+            for i, (norm, score) in enumerate(candidates, 1):
+                console.print(f"  {i}) [{score}] {path_map[norm]}")
+            console.print("  s) Skip", "  m) Manual path")
+            # Default to first candidate on Enter for faster manual resolution
+            choice = Prompt.ask(
+                "Choice",
+                choices=[str(i) for i in range(1, len(candidates) + 1)] + ["s", "m"],
+                default="1",
+            )
+            if choice.isdigit() and 1 <= int(choice) <= len(candidates):
+                manual_matches[track] = path_map[candidates[int(choice) - 1][0]]
+            elif choice == "m":
+                manual_path = Prompt.ask("Enter full path").strip()
+                if manual_path and Path(manual_path).exists():
+                    manual_matches[track] = manual_path
+                else:
+                    manual_matches[track] = None
             else:
                 manual_matches[track] = None
-        else:
-            manual_matches[track] = None
+    finally:
+        # Don't keep scoring tracks the user will never see (e.g. on abort)
+        executor.shutdown(wait=False, cancel_futures=True)
     return manual_matches
 
 
@@ -975,7 +1030,7 @@ def simple_find_matches(
     """
     Simple fuzzy-ratio matcher similar to scripts/archive/gg.py.
     - Builds a norm->path map from the library index.
-    - For each query string, computes direct ratio against top fuzzy candidates.
+    - For each query string, finds the library entry with the best direct ratio.
     - Accepts best candidate if score >= threshold.
     """
     # Filter hidden entries (AppleDouble, etc.) like the other paths do
@@ -995,23 +1050,11 @@ def simple_find_matches(
             best_score = 0.0
             if norm_query in path_map:
                 best_path, best_score = path_map[norm_query], 100.0
-            else:
-                # Seed with fuzzy choices to avoid scoring against the whole library
-                seeds = (
-                    [
-                        c[0]
-                        for c in fuzzy_process.extract(
-                            norm_query, library_choices, limit=50
-                        )
-                    ]
-                    if library_choices
-                    else []
-                )
-                for cand_norm in seeds:
-                    score = _rf_ratio(norm_query, cand_norm)
-                    if score > best_score:
-                        best_score = score
-                        best_path = path_map[cand_norm]
+            elif library_choices:
+                # extractOne skips candidates that cannot reach the threshold
+                best = _rf_best_ratio(norm_query, library_choices, float(threshold))
+                if best:
+                    best_path, best_score = path_map[best[0]], best[1]
             if best_path and best_score >= float(threshold):
                 console.print(
                     f"[green]MATCH:[/] '{track}' → '{best_path}' (Score: {int(best_score)})"
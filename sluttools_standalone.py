@@ -29,7 +29,6 @@ WHAT THIS DOESN'T PROVIDE
 ✗ Streaming service playlist fetching
 ✗ Word overlap analysis and quality scoring
 ✗ Alternative candidate suggestions
-✗ Incremental library updates
 
 For the full-featured application with interactive workflows and advanced
 matching, use the complete sluttools package instead.
@@ -44,6 +43,7 @@ Optional (recommended):
   - mutagen: For reading audio file tags (artist, album, title, etc.)
   - rapidfuzz: For fast fuzzy string matching (10-20x faster than fuzzywuzzy)
   - fuzzywuzzy: Alternative fuzzy matching (if rapidfuzz not available)
+  - numpy: With rapidfuzz, scores whole playlists in one batched pass
 
 Install with: pip install mutagen rapidfuzz
 
@@ -155,8 +155,17 @@ SQLite table: flacs
     - year (INTEGER): Release year
     - duration (INTEGER): Duration in seconds
     - format_json (TEXT): JSON with sample_rate, bits_per_sample, channels
+    - norm_artist (TEXT): Normalized artist, precomputed for matching
+    - norm_album (TEXT): Normalized album, precomputed for matching
+    - title_tokens (TEXT): Sorted word tokens of the normalized title
+    - artist_tokens (TEXT): Sorted word tokens of the normalized artist
 
-Indexes on: norm, artist, album, title for fast searching
+Index on: (norm, duration)
+
+FTS5 table: flacs_fts (artist, album, title; external content over flacs,
+kept in sync by triggers). Used by search() and by
+match_playlist(candidate_limit=N) to shortlist candidates before fuzzy
+scoring.
 
 MATCHING ALGORITHM
 ------------------
@@ -168,26 +177,37 @@ For each playlist track, the matcher:
    - Artist similarity
    - Album similarity
    - Duration difference (if available)
-3. Selects best-scoring candidate
+3. Selects best-scoring candidate (first one on ties)
 4. Categorizes result:
    - score >= auto_match_threshold (default 88): Auto-matched
    - score >= review_min_threshold (default 70): Needs review
    - score < review_min_threshold: Unmatched
 
 Score calculation:
-    - Title: fuzz.ratio() * 2 (most important)
-    - Artist: fuzz.ratio()
+    - Title: fuzz.ratio() of sorted word tokens * 2 (most important; ratios
+      rounded to integers)
+    - Artist: fuzz.ratio() of sorted word tokens
     - Album: fuzz.ratio()
     - Duration: 100 if ≤2s diff, 80 if ≤5s, 60 if ≤10s, else 40
     - Final: Weighted average of available fields
 
 PERFORMANCE NOTES
 -----------------
-- Library scanning uses ThreadPoolExecutor (not ProcessPoolExecutor)
-- Avoids pickle issues with in-memory databases
+- Library scanning parses tags in a ProcessPoolExecutor (map, chunksize=64)
+  since mutagen is pure Python; only the parent process touches SQLite
+- Parsed rows go through a bounded queue to a writer thread that upserts
+  them in batches of 1000, so inserts overlap with tag parsing
+- In-memory databases scan with a ThreadPoolExecutor instead
+- On spawn-based platforms (macOS, Windows) call scan() from code guarded
+  by `if __name__ == "__main__":`
 - Default 4 workers, increase for large libraries
 - In-memory database is faster but non-persistent
-- File database enables incremental updates (future)
+- With rapidfuzz + numpy, match_playlist scores all query/library pairs
+  with rapidfuzz.process.cdist instead of a per-pair Python loop
+- Without numpy, scoring runs inside SQLite through a registered SQL
+  function, and only each winning row is loaded
+- With a file database, rescans only parse new or modified files (by mtime)
+  and drop rows for files deleted from the library paths
 
 COMPARISON WITH FULL SLUTTOOLS
 ------------------------------
@@ -227,16 +247,20 @@ Extracted from sluttools by Georges Khawam
 For the complete application: poetry install && poetry run slut --help
 """
 
-import concurrent.futures
+import functools
 import json
 import logging
+import math
+import os
+import queue
 import re
 import sqlite3
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     from mutagen import File as MutagenFile
@@ -266,6 +290,17 @@ except ImportError:
                 return int(100 * (1 - diff / max_len))
 
 
+try:
+    import numpy as np
+    from rapidfuzz import process as rf_process
+
+    # Batch scoring needs rapidfuzz's cdist; the fuzzywuzzy and fallback
+    # ratios differ from rapidfuzz, so they always use the scalar loop.
+    VECTORIZED_MATCHING = RAPIDFUZZ_AVAILABLE
+except ImportError:
+    VECTORIZED_MATCHING = False
+
+
 # Configuration
 DEFAULT_AUDIO_EXTENSIONS = {
     ".flac",
@@ -284,11 +319,57 @@ logger = logging.getLogger(__name__)
 # UTILITIES
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=65536)
 def normalize_string(s: Optional[str]) -> str:
-    """Normalize string for matching (lowercase, whitespace collapsed)."""
+    """Normalize string for matching (lowercase, whitespace collapsed).
+
+    Cached because artist and album values repeat across every track of an
+    album.
+    """
     if s is None:
         return ""
-    return " ".join(s.strip().lower().split())
+    return _WS_RE.sub(" ", s).strip().lower()
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _sorted_tokens(normalized: str) -> str:
+    """
+    Word tokens of a normalized string in sorted order, so that "The Beatles"
+    and "Beatles, The" compare equal. Strings without word characters are
+    returned unchanged.
+    """
+    return " ".join(sorted(_TOKEN_RE.findall(normalized))) or normalized
+
+
+def _match_fields(title, artist, album) -> tuple:
+    """
+    Fields compared by the matcher: sorted title and artist tokens (a
+    token-sort ratio without sorting per comparison) and the normalized
+    album.
+    """
+    return (
+        _sorted_tokens(normalize_string(title)),
+        _sorted_tokens(normalize_string(artist)),
+        normalize_string(album),
+    )
+
+
+def _derived_columns(title, artist, album) -> tuple:
+    """Values of _DERIVED_COLUMNS for a track, computed at index time."""
+    norm_title = normalize_string(title)
+    norm_artist = normalize_string(artist)
+    return (
+        norm_title,
+        norm_artist,
+        normalize_string(album),
+        _sorted_tokens(norm_title),
+        _sorted_tokens(norm_artist),
+    )
 
 
 def parse_filename_structure(path: Union[Path, str]) -> Dict[str, Any]:
@@ -341,10 +422,16 @@ def parse_filename_structure(path: Union[Path, str]) -> Dict[str, Any]:
     }
 
 
-def gather_metadata(path: Union[Path, str]) -> Dict[str, Any]:
+def gather_metadata(
+    path: Union[Path, str], mtime: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Gather metadata from audio file.
 
+    Args:
+        path: Audio file to read
+        mtime: Modification time, if the caller already stat'ed the file
+
     Returns dict with: path, artist, album, title, trackno, year,
     duration, format
     """
@@ -354,11 +441,22 @@ def gather_metadata(path: Union[Path, str]) -> Dict[str, Any]:
     # Try to get metadata from audio tags if mutagen is available
     if MUTAGEN_AVAILABLE:
         try:
-            audio = MutagenFile(path)
+            with open(path, "rb") as fileobj:
+                if hasattr(os, "posix_fadvise"):
+                    # Larger readahead for tag parsing on slow or remote disks
+                    try:
+                        os.posix_fadvise(
+                            fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                        )
+                    except OSError:
+                        pass
+                # easy=True maps MP3/MP4 tag frames to the plain keys tried
+                # first below; the aliases remain for ID3 in WAV/AIFF files.
+                audio = MutagenFile(fileobj, easy=True)
             if audio is not None:
                 # Extract common tags
-                if hasattr(audio, "tags") and audio.tags:
-                    tags = audio.tags
+                tags = getattr(audio, "tags", None)
+                if tags:
 
                     # Handle different tag formats (ID3, Vorbis, etc.)
                     def get_tag(keys):
@@ -402,31 +500,136 @@ def gather_metadata(path: Union[Path, str]) -> Dict[str, Any]:
                         except Exception:
                             pass
 
+                info = audio.info
+
                 # Get duration
-                if hasattr(audio.info, "length"):
-                    metadata["duration"] = int(audio.info.length)
+                if hasattr(info, "length"):
+                    metadata["duration"] = int(info.length)
 
                 # Get format info
-                if hasattr(audio.info, "sample_rate"):
+                if hasattr(info, "sample_rate"):
                     metadata["format"] = {
-                        "sample_rate": audio.info.sample_rate,
-                        "bits_per_sample": getattr(
-                            audio.info, "bits_per_sample", None
-                        ),  # noqa: E501
-                        "channels": getattr(audio.info, "channels", None),
+                        "sample_rate": info.sample_rate,
+                        "bits_per_sample": getattr(info, "bits_per_sample", None),
+                        "channels": getattr(info, "channels", None),
                     }
         except Exception as e:
             logger.debug(f"Could not read tags from {path}: {e}")
 
-    metadata["mtime"] = int(path.stat().st_mtime) if path.exists() else 0
+    if mtime is None:
+        try:
+            mtime = int(path.stat().st_mtime)
+        except OSError:
+            mtime = 0
+    metadata["mtime"] = mtime
 
     return metadata
 
 
+def _iter_audio_files(root: Path, extensions: set) -> Iterator[Tuple[Path, int]]:
+    """
+    Walk ``root`` once with os.scandir, yielding (path, mtime) for files whose
+    lowercased suffix is in ``extensions``. Directory symlinks are not
+    followed; unreadable directories and files are skipped.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in extensions:
+                            yield Path(entry.path), int(entry.stat().st_mtime)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Cannot read directory: {e}")
+
+
+def _safe_gather_metadata(path: Path, mtime: Optional[int] = None) -> tuple:
+    """
+    gather_metadata wrapper for executor.map: returns (path, metadata, error)
+    instead of raising, so one unreadable file does not abort a scan.
+    """
+    try:
+        return path, gather_metadata(path, mtime), None
+    except Exception as e:
+        return path, None, str(e)
+
+
 ###############################################################################
 # DATABASE
 ###############################################################################
 
+# Upsert rather than REPLACE: REPLACE deletes the old row without firing the
+# FTS delete trigger.
+_UPSERT_TRACK_SQL = """
+    INSERT INTO flacs
+    (path, mtime, artist, album, title,
+     trackno, year, duration, format_json,
+     norm, norm_artist, norm_album, title_tokens, artist_tokens)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        mtime=excluded.mtime,
+        artist=excluded.artist, album=excluded.album,
+        title=excluded.title, trackno=excluded.trackno,
+        year=excluded.year, duration=excluded.duration,
+        format_json=excluded.format_json,
+        norm=excluded.norm,
+        norm_artist=excluded.norm_artist,
+        norm_album=excluded.norm_album,
+        title_tokens=excluded.title_tokens,
+        artist_tokens=excluded.artist_tokens
+"""
+
+# Columns derived from title/artist/album at index time, in the order
+# returned by _derived_columns
+_DERIVED_COLUMNS = (
+    "norm",
+    "norm_artist",
+    "norm_album",
+    "title_tokens",
+    "artist_tokens",
+)
+
+# Library columns compared against a QueryKey's title, artist and album
+_MATCH_COLUMNS = ("title_tokens", "artist_tokens", "norm_album")
+
+# Rows written per executemany/commit during scan()
+_INSERT_BATCH_SIZE = 1000
+
+# Parsed rows buffered between scan() and its writer thread
+_WRITE_QUEUE_SIZE = 4096
+
+
+def _write_rows(conn: sqlite3.Connection, rows: queue.Queue, errors: List[Exception]):
+    """
+    Upsert rows taken from a queue in batches until a None sentinel arrives.
+
+    Runs in scan()'s writer thread. The first failure is appended to errors
+    for scan() to re-raise; later rows are still taken off the queue (and
+    dropped) so the producer never blocks on a full queue.
+    """
+    batch = []
+    while True:
+        row = rows.get()
+        if row is not None:
+            batch.append(row)
+            if len(batch) < _INSERT_BATCH_SIZE:
+                continue
+        if batch and not errors:
+            try:
+                conn.executemany(_UPSERT_TRACK_SQL, batch)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                errors.append(e)
+        batch = []
+        if row is None:
+            return
+
 
 class MusicLibrary:
     """Manages a SQLite database of music files."""
@@ -450,6 +653,10 @@ class MusicLibrary:
         self.db_path = Path(db_path) if db_path else ":memory:"
         self.audio_extensions = audio_extensions or DEFAULT_AUDIO_EXTENSIONS
         self._conn: Optional[sqlite3.Connection] = None
+        self.fts_enabled = False
+        # Bumped whenever scan() changes rows; keys the match array cache.
+        self._generation = 0
+        self._match_arrays: Optional[tuple] = None
 
         # Initialize database
         self._init_db()
@@ -459,10 +666,11 @@ class MusicLibrary:
         """Context manager for database connections."""
         if self._conn is None:
             if self.db_path == ":memory:":
-                self._conn = sqlite3.connect(":memory:")
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
             else:
                 self.db_path.parent.mkdir(parents=True, exist_ok=True)
-                self._conn = sqlite3.connect(str(self.db_path))
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._configure_connection(self._conn)
 
         try:
             yield self._conn
@@ -470,6 +678,17 @@ class MusicLibrary:
             self._conn.rollback()
             raise
 
+    @staticmethod
+    def _configure_connection(conn: sqlite3.Connection):
+        """Tune a fresh connection for bulk indexing and read-heavy matching."""
+        # page_size only takes effect before the first table is created.
+        conn.execute("PRAGMA page_size=32768")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
@@ -485,74 +704,186 @@ class MusicLibrary:
                     trackno INTEGER,
                     year INTEGER,
                     duration INTEGER,
-                    format_json TEXT
+                    format_json TEXT,
+                    norm_artist TEXT,
+                    norm_album TEXT,
+                    title_tokens TEXT,
+                    artist_tokens TEXT
                 )
             """
             )
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_norm ON flacs(norm)")
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_artist ON flacs(artist)"
-            )  # noqa: E501
+            self._migrate_schema(conn)
+            # (norm, duration) serves norm lookups as well as title plus
+            # duration-band prefilters, so it replaces the plain norm index.
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_album ON flacs(album)"
-            )  # noqa: E501
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_title ON flacs(title)"
-            )  # noqa: E501
+                "CREATE INDEX IF NOT EXISTS idx_norm_dur ON flacs(norm, duration)"
+            )
+            # Searches go through flacs_fts; leading-wildcard LIKE could never
+            # use these, so drop them from databases created before FTS.
+            for index in ("idx_norm", "idx_artist", "idx_album", "idx_title"):
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+            self.fts_enabled = self._init_fts(conn)
             conn.commit()
 
+    def _migrate_schema(self, conn: sqlite3.Connection):
+        """Add and backfill the derived matching columns on older databases."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(flacs)")}
+        missing = [c for c in _DERIVED_COLUMNS if c not in columns]
+        if not missing:
+            return
+
+        for column in missing:
+            conn.execute(f"ALTER TABLE flacs ADD COLUMN {column} TEXT")
+        rows = conn.execute("SELECT path, title, artist, album FROM flacs").fetchall()
+        assignments = ", ".join(f"{c}=?" for c in _DERIVED_COLUMNS)
+        conn.executemany(
+            f"UPDATE flacs SET {assignments} WHERE path=?",
+            [
+                (*_derived_columns(title, artist, album), path)
+                for path, title, artist, album in rows
+            ],
+        )
+
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the FTS5 index used to shortlist match candidates.
+
+        flacs_fts is an external-content table over flacs, kept in sync by
+        triggers. Returns False when SQLite was built without FTS5.
+        """
+        existed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='flacs_fts'"
+        ).fetchone()
+        try:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS flacs_fts USING fts5(
+                    artist, album, title,
+                    content='flacs', content_rowid='rowid',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """
+            )
+        except sqlite3.OperationalError as e:
+            logger.debug(f"FTS5 unavailable, candidate shortlists disabled: {e}")
+            return False
+
+        conn.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS flacs_fts_ai AFTER INSERT ON flacs BEGIN
+                INSERT INTO flacs_fts(rowid, artist, album, title)
+                VALUES (new.rowid, new.artist, new.album, new.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS flacs_fts_ad AFTER DELETE ON flacs BEGIN
+                INSERT INTO flacs_fts(flacs_fts, rowid, artist, album, title)
+                VALUES ('delete', old.rowid, old.artist, old.album, old.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS flacs_fts_au AFTER UPDATE ON flacs BEGIN
+                INSERT INTO flacs_fts(flacs_fts, rowid, artist, album, title)
+                VALUES ('delete', old.rowid, old.artist, old.album, old.title);
+                INSERT INTO flacs_fts(rowid, artist, album, title)
+                VALUES (new.rowid, new.artist, new.album, new.title);
+            END;
+        """
+        )
+        if not existed:
+            # Index rows written by versions that had no FTS table.
+            conn.execute("INSERT INTO flacs_fts(flacs_fts) VALUES ('rebuild')")
+        return True
+
     def scan(
         self,
         max_workers: int = 4,
         progress_callback: Optional[callable] = None,
     ):
         """
-        Scan library paths and index audio files.
+        Scan library paths and index new or modified audio files.
+
+        Files whose mtime matches the indexed row are skipped, and rows for
+        files that disappeared from an existing library path are deleted.
 
         Args:
             max_workers: Number of parallel workers for metadata extraction
             progress_callback: Optional callback(current, total) for
                 progress tracking
         """
-        # Find all audio files
+        # Find all audio files, with their mtime
+        extensions = {ext.lower() for ext in self.audio_extensions}
+        found: Dict[str, int] = {}
         audio_files = []
+        prefixes = []
         for lib_path in self.library_paths:
             if not lib_path.exists():
                 logger.warning(f"Library path does not exist: {lib_path}")
                 continue
 
-            for ext in self.audio_extensions:
-                audio_files.extend(lib_path.rglob(f"*{ext}"))
+            prefixes.append(str(lib_path).rstrip(os.sep) + os.sep)
+            for file_path, mtime in _iter_audio_files(lib_path, extensions):
+                found[str(file_path)] = mtime
+                audio_files.append(file_path)
+
+        with self._get_connection() as conn:
+            indexed_mtimes = dict(conn.execute("SELECT path, mtime FROM flacs"))
+            # Only purge under roots that exist, so an unmounted volume does
+            # not wipe its tracks from the index.
+            vanished = [
+                (path,)
+                for path in indexed_mtimes
+                if path not in found and path.startswith(tuple(prefixes))
+            ]
+            if vanished:
+                conn.executemany("DELETE FROM flacs WHERE path = ?", vanished)
+                conn.commit()
+                self._generation += 1
+                logger.info(f"Removed {len(vanished)} vanished files from index")
 
         if not audio_files:
             logger.warning("No audio files found in library paths")
             return
 
-        logger.info(f"Found {len(audio_files)} audio files to index")
+        audio_files = [
+            f for f in audio_files if indexed_mtimes.get(str(f)) != found[str(f)]
+        ]
+        if not audio_files:
+            logger.info("Library index is up to date")
+            return
 
-        # Extract metadata in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(gather_metadata, f): f for f in audio_files
-            }  # noqa: E501
+        logger.info(f"Found {len(audio_files)} new or modified audio files to index")
 
-            indexed = 0
-            with self._get_connection() as conn:
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        metadata = future.result()
-
-                        # Insert into database
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO flacs
-                            (path, norm, mtime, artist, album, title,
-                             trackno, year, duration, format_json)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                            (
+        # Tag parsing is CPU-bound pure Python, so file-backed libraries
+        # parse in worker processes; in-memory libraries keep using threads.
+        if self.db_path == ":memory:":
+            executor_cls = ThreadPoolExecutor
+        else:
+            executor_cls = ProcessPoolExecutor
+
+        indexed = 0
+        rows: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        write_errors: List[Exception] = []
+        with self._get_connection() as conn:
+            # Only the writer thread uses the connection until it is joined.
+            writer = threading.Thread(
+                target=_write_rows,
+                args=(conn, rows, write_errors),
+                name="library-writer",
+                daemon=True,
+            )
+            writer.start()
+            try:
+                with executor_cls(max_workers=max_workers) as executor:
+                    for path, metadata, error in executor.map(
+                        _safe_gather_metadata,
+                        audio_files,
+                        [found[str(f)] for f in audio_files],
+                        chunksize=64,
+                    ):
+                        if error is not None:
+                            logger.error(f"Error indexing {path}: {error}")
+                            continue
+
+                        try:
+                            row = (
                                 metadata["path"],
-                                normalize_string(metadata.get("title", "")),
                                 metadata.get("mtime", 0),
                                 metadata.get("artist"),
                                 metadata.get("album"),
@@ -561,17 +892,31 @@ class MusicLibrary:
                                 metadata.get("year"),
                                 metadata.get("duration"),
                                 json.dumps(metadata.get("format", {})),
-                            ),
-                        )
-
+                                *_derived_columns(
+                                    metadata.get("title"),
+                                    metadata.get("artist"),
+                                    metadata.get("album"),
+                                ),
+                            )
+                        except Exception as e:
+                            logger.error(f"Error indexing {path}: {e}")
+                            continue
+
+                        rows.put(row)
                         indexed += 1
                         if progress_callback and indexed % 100 == 0:
                             progress_callback(indexed, len(audio_files))
+            finally:
+                rows.put(None)
+                writer.join()
+                self._generation += 1
 
-                    except Exception as e:
-                        logger.error(f"Error indexing {futures[future]}: {e}")
+            if write_errors:
+                raise write_errors[0]
 
-                conn.commit()
+            # Refresh planner statistics: a full ANALYZE after the first
+            # load, the cheaper PRAGMA optimize on incremental rescans.
+            conn.execute("PRAGMA optimize" if indexed_mtimes else "ANALYZE")
 
         logger.info(f"Indexed {indexed} audio files")
 
@@ -585,68 +930,232 @@ class MusicLibrary:
         """
         Search library for matching tracks.
 
+        Uses the FTS5 index when available: every word of each given field
+        must prefix-match a word of that field (case and diacritics
+        ignored), best bm25 rank first. Without FTS5, or for values with no
+        word characters, falls back to substring LIKE matching on the
+        normalized columns.
+
         Args:
-            artist: Artist name to search for (fuzzy)
-            album: Album name to search for (fuzzy)
-            title: Title to search for (fuzzy)
+            artist: Artist name to search for
+            album: Album name to search for
+            title: Title to search for
             limit: Maximum number of results
 
         Returns:
             List of matching track dicts
         """
+        terms = []
+        use_fts = self.fts_enabled
+        for field, value in (("artist", artist), ("album", album), ("title", title)):
+            if not value:
+                continue
+            tokens = _TOKEN_RE.findall(normalize_string(value))
+            use_fts = use_fts and bool(tokens)
+            terms.extend(f'{field}:"{token}"*' for token in tokens)
+
         with self._get_connection() as conn:
+            if use_fts and terms:
+                cursor = conn.execute(
+                    """
+                    SELECT flacs.* FROM flacs_fts
+                    JOIN flacs ON flacs.rowid = flacs_fts.rowid
+                    WHERE flacs_fts MATCH ?
+                    ORDER BY flacs_fts.rank
+                    LIMIT ?
+                """,
+                    (" AND ".join(terms), limit),
+                )
+                return self._fetch_tracks(cursor)
+
+            # Compare against the columns normalized at index time; LIKE only
+            # folds ASCII case, so raw tags would miss e.g. "BJÖRK".
             query = "SELECT * FROM flacs WHERE 1=1"
             params = []
 
-            if artist:
-                query += " AND artist LIKE ?"
-                params.append(f"%{artist}%")
-            if album:
-                query += " AND album LIKE ?"
-                params.append(f"%{album}%")
-            if title:
-                query += " AND title LIKE ?"
-                params.append(f"%{title}%")
+            for column, value in (
+                ("norm_artist", artist),
+                ("norm_album", album),
+                ("norm", title),
+            ):
+                if value:
+                    query += f" AND {column} LIKE ?"
+                    params.append(f"%{normalize_string(value)}%")
 
             query += " LIMIT ?"
             params.append(limit)
 
             cursor = conn.execute(query, params)
-            columns = [desc[0] for desc in cursor.description]
+            return self._fetch_tracks(cursor)
 
-            results = []
-            for row in cursor.fetchall():
-                track = dict(zip(columns, row))
-                if track.get("format_json"):
-                    try:
-                        track["format"] = json.loads(track["format_json"])
-                    except Exception:
-                        track["format"] = {}
-                results.append(track)
+    def get_all_tracks(self, include_format: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get all indexed tracks.
 
-            return results
+        Args:
+            include_format: Include format_json and its decoded ``format``
+                dict. Pass False when only tags are needed, e.g. for
+                matching, to skip reading and parsing the JSON of every row.
+        """
+        with self._get_connection() as conn:
+            if include_format:
+                return self._fetch_tracks(conn.execute("SELECT * FROM flacs"))
+
+            columns = [
+                row[1]
+                for row in conn.execute("PRAGMA table_info(flacs)")
+                if row[1] != "format_json"
+            ]
+            cursor = conn.execute(f"SELECT {', '.join(columns)} FROM flacs")
+            return self._fetch_tracks(cursor)
+
+    def load_columns(self) -> Dict[str, List[Any]]:
+        """
+        Return the fields used for matching as parallel column lists.
 
-    def get_all_tracks(self) -> List[Dict[str, Any]]:
-        """Get all indexed tracks."""
+        Keys: path, title_tokens, artist_tokens, norm_album, duration. Rows
+        are in the same order as get_all_tracks().
+        """
+        keys = ("path", *_MATCH_COLUMNS, "duration")
         with self._get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM flacs")
-            columns = [desc[0] for desc in cursor.description]
+            rows = conn.execute(f"SELECT {', '.join(keys)} FROM flacs").fetchall()
+        if not rows:
+            return {key: [] for key in keys}
+        return {key: list(values) for key, values in zip(keys, zip(*rows))}
 
-            results = []
-            for row in cursor.fetchall():
-                track = dict(zip(columns, row))
-                if track.get("format_json"):
-                    try:
-                        track["format"] = json.loads(track["format_json"])
-                    except Exception:
-                        track["format"] = {}
-                results.append(track)
+    def get_match_arrays(self) -> "_MatchArrays":
+        """
+        Library columns prepared for batched matching (requires numpy).
+
+        Cached until the next scan() that changes rows, so matching several
+        playlists against the same library loads and converts them once.
+        Writes made outside this MusicLibrary instance are not detected.
+        """
+        if self._match_arrays is None or self._match_arrays[0] != self._generation:
+            arrays = _MatchArrays.from_columns(self.load_columns())
+            self._match_arrays = (self._generation, arrays)
+        return self._match_arrays[1]
+
+    def best_match(self, query_key: "QueryKey") -> tuple:
+        """
+        Find the best-scoring track for a prepared query inside SQLite.
 
-            return results
+        The scorer is registered as a SQL function over the match columns,
+        so library rows are never materialized in Python; only the winner
+        is fetched. Used when numpy is unavailable for batched scoring.
+
+        Returns:
+            (track dict or None, score), first row in table order on ties
+        """
+        best = 0
+
+        def match_score(title, artist, album, duration):
+            nonlocal best
+            c_fields = (title or "", artist or "", album or "")
+            # A row whose bound cannot beat the best so far could at most tie
+            # it, and ties go to the earlier row, so skip its ratios.
+            if best and (
+                _score_upper_bound(
+                    query_key.fields, c_fields, query_key.duration, duration
+                )
+                <= best
+            ):
+                return 0
+            score = _score_fields(
+                query_key.fields, c_fields, query_key.duration, duration
+            )
+            best = max(best, score)
+            return score
+
+        with self._get_connection() as conn:
+            conn.create_function("match_score", 4, match_score)
+            row = conn.execute(
+                f"SELECT path, match_score({', '.join(_MATCH_COLUMNS)}, duration)"
+                " AS score FROM flacs ORDER BY score DESC, rowid LIMIT 1"
+            ).fetchone()
+
+        if row is None or not row[1]:
+            return None, 0
+        path, score = row
+        return self.get_tracks([path]).get(path), score
+
+    def get_tracks(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch full track dicts for the given paths, keyed by path."""
+        tracks: Dict[str, Dict[str, Any]] = {}
+        unique = list(dict.fromkeys(paths))
+        with self._get_connection() as conn:
+            # Stay under SQLite's default limit of 999 bound parameters.
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                cursor = conn.execute(
+                    "SELECT * FROM flacs WHERE path IN "
+                    f"({', '.join('?' for _ in chunk)})",
+                    chunk,
+                )
+                for track in self._fetch_tracks(cursor):
+                    tracks[track["path"]] = track
+        return tracks
+
+    def shortlist(
+        self, query: Union[Dict[str, Any], "QueryKey"], limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Return up to ``limit`` tracks sharing at least one word with the query.
+
+        Candidates are ranked by FTS5 bm25 over artist, album and title.
+        Returns an empty list when FTS5 is unavailable or the query has no
+        words.
+        """
+        if not isinstance(query, QueryKey):
+            query = prepare_query(query)
+        terms = []
+        for field, value in zip(("title", "artist", "album"), query.fields):
+            for word in dict.fromkeys(value.split()):
+                terms.append(f'{field}:"{word.replace(chr(34), chr(34) * 2)}"')
+        if not self.fts_enabled or not terms:
+            return []
+
+        with self._get_connection() as conn:
+            try:
+                cursor = conn.execute(
+                    """
+                    SELECT flacs.* FROM flacs_fts
+                    JOIN flacs ON flacs.rowid = flacs_fts.rowid
+                    WHERE flacs_fts MATCH ?
+                    ORDER BY flacs_fts.rank
+                    LIMIT ?
+                """,
+                    (" OR ".join(terms), limit),
+                )
+            except sqlite3.OperationalError as e:
+                logger.debug(f"FTS shortlist failed for {query}: {e}")
+                return []
+            return self._fetch_tracks(cursor)
+
+    @staticmethod
+    def _fetch_tracks(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """Convert result rows to track dicts with decoded format info."""
+        columns = [desc[0] for desc in cursor.description]
+
+        results = []
+        for row in cursor.fetchall():
+            track = dict(zip(columns, row))
+            if track.get("format_json"):
+                try:
+                    track["format"] = json.loads(track["format_json"])
+                except Exception:
+                    track["format"] = {}
+            results.append(track)
+
+        return results
 
     def close(self):
         """Close database connection."""
         if self._conn:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.debug(f"PRAGMA optimize failed: {e}")
             self._conn.close()
             self._conn = None
 
@@ -666,6 +1175,121 @@ class Match:
     status: str  # 'matched', 'unmatched', 'review'
 
 
+@dataclass(frozen=True)
+class QueryKey:
+    """A playlist track with its match fields normalized once."""
+
+    title: str
+    artist: str
+    album: str
+    duration: Optional[float]
+
+    @property
+    def fields(self) -> tuple:
+        return (self.title, self.artist, self.album)
+
+
+def _normalized_fields(track: Dict[str, Any]) -> tuple:
+    """Match fields (title, artist, album) of a track, see _match_fields."""
+    return _match_fields(
+        track.get("title", ""), track.get("artist", ""), track.get("album", "")
+    )
+
+
+def prepare_query(query: Dict[str, Any]) -> QueryKey:
+    """Normalize a playlist track for repeated scoring."""
+    return QueryKey(*_normalized_fields(query), duration=query.get("duration"))
+
+
+def _candidate_fields(candidate: Dict[str, Any]) -> tuple:
+    """
+    Match fields (title, artist, album) of a library track.
+
+    Rows read from the database carry the values precomputed at index time
+    in title_tokens, artist_tokens and norm_album; other dicts are
+    normalized here.
+    """
+    if "title_tokens" in candidate:
+        return tuple(candidate[column] or "" for column in _MATCH_COLUMNS)
+    return _normalized_fields(candidate)
+
+
+# Duration score by ceil(|difference| in seconds), capped at the last entry:
+# 100 within 2s, 80 within 5s, 60 within 10s, else 40. The thresholds are
+# whole seconds, so diff <= n exactly when ceil(diff) <= n.
+_DURATION_SCORES = (100, 100, 100, 80, 80, 80, 60, 60, 60, 60, 60, 40)
+
+
+def _duration_score(q_duration, c_duration) -> int:
+    """Score a duration difference in seconds."""
+    diff = abs(q_duration - c_duration)
+    return _DURATION_SCORES[min(math.ceil(diff), len(_DURATION_SCORES) - 1)]
+
+
+def _score_fields(q_fields: tuple, c_fields: tuple, q_duration, c_duration) -> int:
+    """Score pre-normalized (title, artist, album) fields and durations."""
+    scores = []
+
+    # Title matching (most important), then artist and album. Ratios are
+    # rounded half up to integers, as rapidfuzz's uint8 cdist output is.
+    for q_value, c_value, weight in zip(q_fields, c_fields, (2, 1, 1)):
+        if q_value and c_value:
+            scores.append(int(fuzz.ratio(q_value, c_value) + 0.5) * weight)
+
+    # Duration matching (if available)
+    if q_duration and c_duration:
+        scores.append(_duration_score(q_duration, c_duration))
+
+    # Return weighted average
+    if not scores:
+        return 0
+
+    return int(sum(scores) / len(scores))
+
+
+def _score_upper_bound(q_fields: tuple, c_fields: tuple, q_duration, c_duration) -> int:
+    """
+    Highest score _score_fields could return for these fields.
+
+    An edit-based ratio of strings with lengths a and b can never exceed
+    200 * min(a, b) / (a + b), so candidates whose lengths differ too much
+    to beat the current best can be skipped without computing any ratio.
+    """
+    scores = []
+    for q_value, c_value, weight in zip(q_fields, c_fields, (2, 1, 1)):
+        if q_value and c_value:
+            q_len, c_len = len(q_value), len(c_value)
+            bound = math.ceil(200 * min(q_len, c_len) / (q_len + c_len))
+            scores.append(bound * weight)
+
+    if q_duration and c_duration:
+        scores.append(_duration_score(q_duration, c_duration))
+
+    if not scores:
+        return 0
+
+    return int(sum(scores) / len(scores))
+
+
+def score_against(query_key: QueryKey, candidate: Dict[str, Any]) -> int:
+    """
+    Score a prepared query against a candidate library track.
+
+    Args:
+        query_key: Query prepared with prepare_query
+        candidate: Candidate library track dict
+
+    Returns:
+        Score from 0-100
+    """
+    return _score_fields(
+        query_key.fields,
+        _candidate_fields(candidate),
+        query_key.duration,
+        candidate.get("duration"),
+    )
+
+
 def calculate_match_score(
     query: Dict[str, Any],
     candidate: Dict[str, Any],
@@ -680,45 +1304,138 @@ def calculate_match_score(
     Returns:
         Score from 0-100
     """
-    scores = []
+    return score_against(prepare_query(query), candidate)
 
-    # Title matching (most important)
-    q_title = normalize_string(query.get("title", ""))
-    c_title = normalize_string(candidate.get("title", ""))
-    if q_title and c_title:
-        scores.append(fuzz.ratio(q_title, c_title) * 2)  # Weight title heavily
 
-    # Artist matching
-    q_artist = normalize_string(query.get("artist", ""))
-    c_artist = normalize_string(candidate.get("artist", ""))
-    if q_artist and c_artist:
-        scores.append(fuzz.ratio(q_artist, c_artist))
+# Upper bound on query x library cells scored per cdist call, so large
+# playlists are matched in row chunks with bounded score matrices.
+_MATCH_CHUNK_CELLS = 4_000_000
 
-    # Album matching
-    q_album = normalize_string(query.get("album", ""))
-    c_album = normalize_string(candidate.get("album", ""))
-    if q_album and c_album:
-        scores.append(fuzz.ratio(q_album, c_album))
 
-    # Duration matching (if available)
-    q_duration = query.get("duration")
-    c_duration = candidate.get("duration")
-    if q_duration and c_duration:
-        diff = abs(q_duration - c_duration)
-        if diff <= 2:
-            scores.append(100)
-        elif diff <= 5:
-            scores.append(80)
-        elif diff <= 10:
-            scores.append(60)
-        else:
-            scores.append(40)
+def _duration_array(durations: List[Any]) -> "np.ndarray":
+    """Durations as float64, NaN where missing or zero."""
+    return np.array(
+        [float(d) if d else np.nan for d in durations],
+        dtype=np.float64,
+    )
 
-    # Return weighted average
-    if not scores:
-        return 0
 
-    return int(sum(scores) / len(scores))
+@dataclass(frozen=True)
+class _MatchArrays:
+    """Library match columns converted for batched cdist scoring."""
+
+    paths: List[str]
+    fields: List[List[str]]
+    present: List["np.ndarray"]
+    durations: "np.ndarray"
+    durations_present: "np.ndarray"
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> "_MatchArrays":
+        """Build from the column lists returned by MusicLibrary.load_columns."""
+        fields = [[value or "" for value in columns[key]] for key in _MATCH_COLUMNS]
+        durations = _duration_array(columns["duration"])
+        return cls(
+            paths=columns["path"],
+            fields=fields,
+            present=[np.array([bool(v) for v in values]) for values in fields],
+            durations=durations,
+            durations_present=~np.isnan(durations),
+        )
+
+
+def _best_candidates_vectorized(
+    queries: List[QueryKey],
+    library: _MatchArrays,
+) -> List[tuple]:
+    """
+    Score every query against every candidate with rapidfuzz cdist.
+
+    Reproduces calculate_match_score exactly: each field only counts when
+    present on both sides, and the final score is the truncated average of
+    the present fields. Ratios come back as uint8 and totals are summed in
+    int16 (at most 500), so all arithmetic is integral. Ties resolve to the
+    first candidate, as in the scalar loop.
+
+    Args:
+        queries: Prepared playlist tracks
+        library: Prepared library arrays, see MusicLibrary.get_match_arrays
+
+    Returns:
+        List of (candidate index or None, score) per query
+    """
+    c_fields = library.fields
+    c_present = library.present
+    c_dur = library.durations
+    c_dur_present = library.durations_present
+    n_candidates = len(c_dur)
+    duration_lut = np.array(_DURATION_SCORES, dtype=np.int16)
+
+    rows_per_chunk = max(1, _MATCH_CHUNK_CELLS // max(n_candidates, 1))
+    best: List[tuple] = []
+
+    for start in range(0, len(queries), rows_per_chunk):
+        chunk = queries[start : start + rows_per_chunk]
+        total = np.zeros((len(chunk), n_candidates), dtype=np.int16)
+        count = np.zeros((len(chunk), n_candidates), dtype=np.int8)
+
+        for field, weight in enumerate((2, 1, 1)):
+            q_values = [qk.fields[field] for qk in chunk]
+            q_present = np.array([bool(v) for v in q_values])
+            mask = q_present[:, None] & c_present[field][None, :]
+            ratios = rf_process.cdist(
+                q_values,
+                c_fields[field],
+                scorer=fuzz.ratio,
+                dtype=np.uint8,
+                workers=-1,
+            )
+            total += np.where(mask, ratios.astype(np.int16) * weight, 0)
+            count += mask
+
+        q_dur = _duration_array([qk.duration for qk in chunk])
+        mask = (~np.isnan(q_dur))[:, None] & c_dur_present[None, :]
+        # fmin maps the NaN of missing durations to the last bucket too.
+        buckets = np.fmin(
+            np.ceil(np.abs(q_dur[:, None] - c_dur[None, :])), len(duration_lut) - 1
+        ).astype(np.intp)
+        total += np.where(mask, duration_lut[buckets], 0)
+        count += mask
+
+        scores = np.zeros_like(total)
+        np.floor_divide(total, count, out=scores, where=count > 0)
+        best_idx = np.argmax(scores, axis=1)
+        best_scores = scores[np.arange(len(chunk)), best_idx]
+        for idx, score in zip(best_idx.tolist(), best_scores.tolist()):
+            best.append((idx if score > 0 else None, score))
+
+    return best
+
+
+def _best_candidate(
+    query_key: QueryKey,
+    candidates: List[Dict[str, Any]],
+) -> tuple:
+    """Return (best candidate or None, score), keeping the first on ties."""
+    best_candidate = None
+    best_score = 0
+    q_fields = query_key.fields
+    q_duration = query_key.duration
+
+    for candidate in candidates:
+        c_fields = _candidate_fields(candidate)
+        c_duration = candidate.get("duration")
+        # Skip candidates that cannot beat the best score on length alone.
+        if best_score and (
+            _score_upper_bound(q_fields, c_fields, q_duration, c_duration) <= best_score
+        ):
+            continue
+        score = _score_fields(q_fields, c_fields, q_duration, c_duration)
+        if score > best_score:
+            best_score = score
+            best_candidate = candidate
+
+    return best_candidate, best_score
 
 
 def match_playlist(
@@ -726,6 +1443,7 @@ def match_playlist(
     playlist_tracks: List[Dict[str, Any]],
     auto_match_threshold: int = DEFAULT_AUTO_MATCH_THRESHOLD,
     review_min_threshold: int = DEFAULT_REVIEW_MIN_THRESHOLD,
+    candidate_limit: Optional[int] = None,
 ) -> List[Match]:
     """
     Match playlist tracks against library.
@@ -735,24 +1453,41 @@ def match_playlist(
         playlist_tracks: List of track dicts to match
         auto_match_threshold: Score threshold for auto-accepting matches
         review_min_threshold: Minimum score for review (below = unmatched)
+        candidate_limit: If set and FTS5 is available, only score the top
+            N full-text candidates per track instead of the whole library.
+            Tracks sharing no word with the query are then never considered.
 
     Returns:
         List of Match objects
     """
-    all_library_tracks = library.get_all_tracks()
     matches = []
+    query_keys = [prepare_query(query) for query in playlist_tracks]
 
-    for query in playlist_tracks:
-        best_candidate = None
-        best_score = 0
-
-        # Find best matching candidate
-        for candidate in all_library_tracks:
-            score = calculate_match_score(query, candidate)
-            if score > best_score:
-                best_score = score
-                best_candidate = candidate
+    if candidate_limit and library.fts_enabled:
+        best = [
+            _best_candidate(qk, library.shortlist(qk, candidate_limit))
+            for qk in query_keys
+        ]
+    elif VECTORIZED_MATCHING:
+        arrays = library.get_match_arrays()
+        winners = (
+            _best_candidates_vectorized(query_keys, arrays)
+            if arrays.paths and query_keys
+            else [(None, 0)] * len(query_keys)
+        )
+        # Only the winning rows are materialized as track dicts.
+        paths = arrays.paths
+        tracks = library.get_tracks(
+            [paths[index] for index, _ in winners if index is not None]
+        )
+        best = [
+            (tracks.get(paths[index]) if index is not None else None, score)
+            for index, score in winners
+        ]
+    else:
+        best = [library.best_match(qk) for qk in query_keys]
 
+    for query, (best_candidate, best_score) in zip(playlist_tracks, best):
         # Determine match status
         if best_score >= auto_match_threshold:
             status = "matched"
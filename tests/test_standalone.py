@@ -0,0 +1,249 @@
+"""Tests for the standalone matcher."""
+
+from __future__ import annotations
+
+import queue
+import random
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+import sluttools_standalone as standalone
+
+
+def _scalar_best(queries: list[dict], candidates: list[dict]) -> list[tuple]:
+    best = []
+    for query in queries:
+        best_index, best_score = None, 0
+        for index, candidate in enumerate(candidates):
+            score = standalone.calculate_match_score(query, candidate)
+            if score > best_score:
+                best_index, best_score = index, score
+        best.append((best_index, best_score))
+    return best
+
+
+def _random_track(rng: random.Random) -> dict:
+    words = ["blue", "night", "song", "love", "city", "dream", "fire", "Björk"]
+
+    def field():
+        if rng.random() < 0.15:
+            return rng.choice([None, ""])
+        return " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+
+    return {
+        "title": field(),
+        "artist": field(),
+        "album": field(),
+        "duration": rng.choice([None, 0, rng.randint(120, 300)]),
+    }
+
+
+@pytest.mark.skipif(
+    not standalone.VECTORIZED_MATCHING, reason="requires rapidfuzz and numpy"
+)
+def test_vectorized_scores_match_scalar(monkeypatch):
+    """Batch cdist scoring picks the same candidate and score as the scalar loop."""
+    rng = random.Random(1234)
+    queries = [_random_track(rng) for _ in range(40)]
+    candidates = [_random_track(rng) for _ in range(120)]
+
+    # Force several row chunks to exercise the chunking path.
+    monkeypatch.setattr(standalone, "_MATCH_CHUNK_CELLS", 1000)
+
+    fields = zip(*(standalone._candidate_fields(c) for c in candidates))
+    columns = dict(zip(standalone._MATCH_COLUMNS, map(list, fields)))
+    columns["path"] = [str(i) for i in range(len(candidates))]
+    columns["duration"] = [c["duration"] for c in candidates]
+
+    vectorized = standalone._best_candidates_vectorized(
+        [standalone.prepare_query(q) for q in queries],
+        standalone._MatchArrays.from_columns(columns),
+    )
+    assert vectorized == _scalar_best(queries, candidates)
+
+
+def test_fts_shortlist_tracks_rescans(tmp_path):
+    """The FTS shortlist finds indexed tracks and stays in sync across rescans."""
+    album = tmp_path / "Radiohead" / "Pablo Honey"
+    album.mkdir(parents=True)
+    (album / "02 - Creep.flac").touch()
+    (album / "03 - How Do You.flac").touch()
+
+    lib = standalone.MusicLibrary([tmp_path], db_path=tmp_path / "lib.db")
+    if not lib.fts_enabled:
+        pytest.skip("SQLite built without FTS5")
+    lib.scan()
+    lib.scan()
+
+    query = {"artist": "Radiohead", "title": "Creep"}
+    shortlist = lib.shortlist(query, limit=5)
+    assert shortlist[0]["title"] == "Creep"
+    assert len(shortlist) == 2
+
+    matches = standalone.match_playlist(lib, [query], candidate_limit=5)
+    assert matches[0].library_track["title"] == "Creep"
+    full_scan = standalone.match_playlist(lib, [query])
+    assert full_scan[0].library_track == matches[0].library_track
+    with lib._get_connection() as conn:
+        conn.execute("INSERT INTO flacs_fts(flacs_fts) VALUES ('integrity-check')")
+    lib.close()
+
+
+def test_length_pruning_matches_full_scan():
+    """Upper-bound pruning never changes the selected candidate or score."""
+    rng = random.Random(99)
+    queries = [_random_track(rng) for _ in range(40)]
+    candidates = [_random_track(rng) for _ in range(120)]
+
+    pruned = [
+        (
+            candidates.index(track) if track is not None else None,
+            score,
+        )
+        for track, score in (
+            standalone._best_candidate(standalone.prepare_query(query), candidates)
+            for query in queries
+        )
+    ]
+    assert pruned == _scalar_best(queries, candidates)
+
+
+def test_rescan_only_indexes_changed_files(tmp_path, monkeypatch):
+    """Rescans skip unchanged files and drop rows for deleted ones."""
+    album = tmp_path / "Artist" / "Album"
+    album.mkdir(parents=True)
+    kept = album / "01 - Kept.flac"
+    removed = album / "02 - Removed.flac"
+    kept.touch()
+    removed.touch()
+
+    lib = standalone.MusicLibrary([tmp_path])
+    lib.scan()
+    query = {"artist": "Artist", "album": "Album", "title": "Added"}
+    before = standalone.match_playlist(lib, [query])[0]
+    assert before.library_track["title"] != "Added"
+
+    gathered = []
+    original = standalone.gather_metadata
+
+    def recording_gather_metadata(path, mtime=None):
+        gathered.append(Path(path).name)
+        return original(path, mtime)
+
+    monkeypatch.setattr(standalone, "gather_metadata", recording_gather_metadata)
+    removed.unlink()
+    (album / "03 - Added.flac").touch()
+    lib.scan()
+
+    assert gathered == ["03 - Added.flac"]
+    titles = sorted(t["title"] for t in lib.get_all_tracks())
+    assert titles == ["Added", "Kept"]
+    # Cached match arrays are rebuilt after the rescan.
+    after = standalone.match_playlist(lib, [query])[0]
+    assert after.library_track["title"] == "Added"
+    lib.close()
+
+
+def test_token_order_does_not_affect_score():
+    """Title and artist compare as sorted word tokens."""
+    query = {"artist": "The Beatles", "title": "Let It Be"}
+    candidate = {"artist": "Beatles, The", "title": "Be It Let"}
+    assert standalone.calculate_match_score(
+        query, candidate
+    ) == standalone.calculate_match_score(query, query)
+
+
+def test_scalar_fallback_returns_full_tracks(tmp_path, monkeypatch):
+    """Both match paths return the same complete library row."""
+    album = tmp_path / "Radiohead" / "OK Computer"
+    album.mkdir(parents=True)
+    (album / "01 - Airbag.flac").touch()
+    (album / "02 - Paranoid Android.flac").touch()
+
+    lib = standalone.MusicLibrary([tmp_path])
+    lib.scan()
+    query = {"artist": "Radiohead", "title": "Paranoid Android"}
+
+    default = standalone.match_playlist(lib, [query])
+    monkeypatch.setattr(standalone, "VECTORIZED_MATCHING", False)
+    scalar = standalone.match_playlist(lib, [query])
+
+    assert scalar[0].library_track == default[0].library_track
+    assert "format_json" in scalar[0].library_track
+    assert "format_json" not in lib.get_all_tracks(include_format=False)[0]
+    lib.close()
+
+
+def test_sql_best_match_matches_scalar():
+    """Scoring through the SQL function agrees with the Python scorer."""
+    rng = random.Random(4321)
+    queries = [_random_track(rng) for _ in range(30)]
+    candidates = [_random_track(rng) for _ in range(80)]
+
+    lib = standalone.MusicLibrary([])
+    with lib._get_connection() as conn:
+        conn.executemany(
+            standalone._UPSERT_TRACK_SQL,
+            [
+                (
+                    str(i),
+                    0,
+                    c["artist"],
+                    c["album"],
+                    c["title"],
+                    None,
+                    None,
+                    c["duration"],
+                    "{}",
+                    *standalone._derived_columns(c["title"], c["artist"], c["album"]),
+                )
+                for i, c in enumerate(candidates)
+            ],
+        )
+
+    results = []
+    for query in queries:
+        track, score = lib.best_match(standalone.prepare_query(query))
+        results.append((int(track["path"]) if track else None, score))
+    assert results == _scalar_best(queries, candidates)
+    lib.close()
+
+
+def test_search_uses_prefix_word_matching(tmp_path):
+    """search() matches word prefixes, ignoring case and diacritics."""
+    album = tmp_path / "Björk" / "Homogenic"
+    album.mkdir(parents=True)
+    (album / "01 - Hunter.flac").touch()
+    (album / "02 - Jóga.flac").touch()
+    (tmp_path / "Artist" / "!!!").mkdir(parents=True)
+    (tmp_path / "Artist" / "!!!" / "01 - Heart.flac").touch()
+
+    lib = standalone.MusicLibrary([tmp_path])
+    lib.scan()
+
+    assert [t["title"] for t in lib.search(artist="bjork", title="jog")] == ["Jóga"]
+    assert len(lib.search(album="homo")) == 2
+    assert [t["title"] for t in lib.search(album="!!!")] == ["Heart"]
+    lib.close()
+
+
+def test_writer_reports_errors_and_keeps_draining():
+    """A failed batch is reported once and later rows do not block the queue."""
+    conn = sqlite3.connect(":memory:")
+    rows = queue.Queue(maxsize=2)
+    errors = []
+    writer = threading.Thread(
+        target=standalone._write_rows, args=(conn, rows, errors), daemon=True
+    )
+    writer.start()
+    for i in range(standalone._INSERT_BATCH_SIZE + 10):
+        rows.put((str(i),))
+    rows.put(None)
+    writer.join(timeout=10)
+
+    assert not writer.is_alive()
+    assert len(errors) == 1
+    assert isinstance(errors[0], sqlite3.OperationalError)